@@ -1,12 +1,36 @@
 """CITE: https://github.com/Mahmimi/WebCrawler"""
 
 from selenium import webdriver
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from bs4 import BeautifulSoup, SoupStrainer, Tag, UnicodeDammit
+import soupsieve
+import lxml.html
+from lxml.cssselect import CSSSelector
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import urllib3.exceptions
+import re
+import io
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlsplit
+from functools import lru_cache
 from tqdm.auto import tqdm
 import warnings
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+
+try:
+    # optional, only needed for engine='playwright'
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    async_playwright = PlaywrightTimeoutError = None
 
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 warnings.filterwarnings("ignore", category=UserWarning)
@@ -15,6 +39,339 @@ warnings.filterwarnings("ignore", category=UserWarning)
     TODO: please install supported ChromeDriver with your chrome browser before use.
 """
 
+# seconds to wait for a static page before giving up
+REQUEST_TIMEOUT = 30
+
+# sqlite file and lifetime in seconds of the on-disk HTTP cache used when cache=True
+CACHE_NAME = 'crawler_cache'
+CACHE_EXPIRE_AFTER = 3600
+
+# number of threads fetching static pages side by side through the shared session
+FETCH_WORKERS = 16
+
+# seconds a dynamic page may take to show the element the crawler waits for, see _driver_get()
+DRIVER_WAIT = 10
+
+# number of headless Chrome drivers (or Playwright pages) loading dynamic pages side by side
+DRIVER_WORKERS = 4
+
+# number of batches insert_contents_to_mongoDB() sends side by side, pymongo's client is thread-safe and pools its connections
+INSERT_WORKERS = 8
+
+# user agent of the headless browsers
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# image URLs kept by get_images(), the extension may be followed by a query string or fragment like 'a.png?v=1'
+_IMG_RE = re.compile(r'\.(?:jpe?g|png)(?:$|[?#])', re.IGNORECASE)
+
+# collapses whitespace runs of the extracted content in one pass
+_WS_RE = re.compile(r'\s+')
+
+# the charset of a Content-Type header like 'text/html; charset=utf-8'
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# urljoin() for the relative links of the listing pages, a page usually links to each article several times (title, image, read more)
+_urljoin = lru_cache(maxsize=1024)(urljoin)
+
+def _css_selector(tag:str=None, cls:str=None):
+    """
+    Builds the CSS selector matching `tag` elements that have every class in `cls`.
+
+    Args:
+        tag (str, optional): The HTML tag, may include attribute conditions like 'a[href]'. Defaults to None, which matches any tag.
+        cls (str, optional): The CSS class, several classes are separated by spaces. Defaults to None.
+
+    Returns:
+        str: The CSS selector, with every class name escaped.
+    """
+
+    selector = tag or '*'
+    if cls:
+        selector += ''.join('.' + soupsieve.escape(name) for name in cls.split())
+    return selector
+
+@lru_cache(maxsize=64)
+def _lxml_selector(tag:str=None, cls:str=None):
+    """
+    Compiles _css_selector(tag, cls) to an lxml CSSSelector, for pages parsed with lxml.html without BeautifulSoup.
+    The selector runs as XPath inside libxml2, and the same tag and class are looked up on every page, so it is cached.
+
+    Returns:
+        lxml.cssselect.CSSSelector: The compiled selector, call it with the parsed tree.
+    """
+
+    return CSSSelector(_css_selector(tag, cls))
+
+def _build_session(cache:bool=False):
+    """
+    Builds a requests.Session that keeps connections alive and reuses them for every request to the same host.
+
+    Args:
+        cache (bool, optional): If True, responses are cached on disk in CACHE_NAME.sqlite for CACHE_EXPIRE_AFTER seconds, 
+                                honoring the server's Cache-Control and ETag headers. Defaults to False.
+
+    Returns:
+        requests.Session: A session with a pooled HTTPAdapter mounted for http and https, retrying failed connections 3 times.
+    """
+
+    if cache:
+        # optional, only imported when the cache is used
+        try:
+            import requests_cache
+        except ImportError:
+            raise ImportError("cache=True needs requests-cache, please install it with: pip install requests-cache") from None
+        session = requests_cache.CachedSession(CACHE_NAME, backend='sqlite', expire_after=CACHE_EXPIRE_AFTER, 
+                                               allowable_codes=(200,), stale_if_error=True)
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # requests already sends Connection: keep-alive, only the browser user agent is added
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+def _get_soup(session:requests.Session, url:str, parse_only:SoupStrainer=None):
+    """
+    Fetches a static page and parses it straight from the response stream.
+    Reading response.raw once skips building response.content, which would hold a second copy of the body while it is joined.
+
+    Args:
+        session (requests.Session): The session to fetch the page with.
+        url (str): The URL of the page.
+        parse_only (SoupStrainer, optional): Only build the part of the page matched by this strainer. Defaults to None.
+
+    Returns:
+        BeautifulSoup: Parsed HTML content of the webpage.
+
+    Raises:
+        requests.ConnectionError: If the body can't be read, like a truncated body or a read timeout.
+    """
+
+    with session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as source:
+        # let urllib3 undo gzip/deflate while reading
+        source.raw.decode_content = True
+        try:
+            return BeautifulSoup(source.raw, 'lxml', parse_only=parse_only, from_encoding='utf-8')
+        except urllib3.exceptions.HTTPError as error:
+            # reading response.raw raises urllib3 errors, which requests only wraps when it reads the body itself
+            raise requests.ConnectionError(error) from error
+
+def _build_chrome_options():
+    """
+    Builds the options of the headless Chrome used for dynamic pages.
+
+    Returns:
+        webdriver.ChromeOptions: The headless Chrome options, with images, stylesheets and fonts turned off.
+    """
+
+    options = webdriver.ChromeOptions()
+    # driver.get returns once the DOM is ready, without waiting for images and stylesheets, see _driver_get()
+    options.page_load_strategy = 'eager'
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("start-maximized")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    # only the HTML is scraped, don't download images, stylesheets and fonts
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2,
+                                              "profile.managed_default_content_settings.stylesheets": 2,
+                                              "profile.managed_default_content_settings.fonts": 2})
+    return options
+
+def _driver_get(driver:webdriver.Chrome, url:str, wait_for:str=None):
+    """
+    Loads a page with the driver and waits until the element the crawler needs is present, instead of a fixed wait.
+
+    Args:
+        driver (webdriver.Chrome): The driver to load the page with.
+        url (str): The URL of the page.
+        wait_for (str, optional): The CSS selector of the element to wait for. Defaults to None, which waits for <body>.
+
+    Note:
+        If the element doesn't show up within DRIVER_WAIT seconds the page is left as it is, the content is then not found when parsing.
+    """
+
+    driver.get(url)
+    try:
+        WebDriverWait(driver, DRIVER_WAIT).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for or 'body')))
+    except TimeoutException:
+        pass
+
+def _lxml_tree(html):
+    """
+    Parses a page with lxml.html, without BeautifulSoup.
+
+    Args:
+        html (str, bytes or file-like): The HTML of the page, a file-like object like response.raw is read first.
+
+    Returns:
+        lxml.html.HtmlElement: The root element, or None if the page is empty.
+
+    Note:
+        The encoding of bytes is the charset of the response headers if it decodes the page, otherwise utf-8 is tried
+        before the <meta charset> and guessing, like BeautifulSoup(..., from_encoding='utf-8') does.
+    """
+
+    if isinstance(html, str):
+        return lxml.html.parse(io.StringIO(html)).getroot()
+
+    encodings = []
+    if not isinstance(html, bytes):
+        # response.raw keeps the headers of the response
+        match = _CHARSET_RE.search(getattr(html, 'headers', {}).get('Content-Type', ''))
+        if match:
+            encodings.append(match.group(1))
+        html = html.read()
+    if not html:
+        # empty page, nothing to detect the encoding of
+        return None
+    encodings.append('utf-8')
+
+    encoding = UnicodeDammit(html, encodings, is_html=True).original_encoding
+    parser = lxml.html.HTMLParser(encoding=encoding)
+    return lxml.html.parse(io.BytesIO(html), parser).getroot()
+
+# event loop running in a daemon thread that holds the Playwright Chromium between calls, see _run_playwright()
+_playwright_loop = None
+_playwright_lock = threading.Lock()
+# the running Playwright, its headless Chromium and the pages left open for the next load
+_playwright = None
+_playwright_browser = None
+_playwright_pages = []
+
+async def _playwright_start():
+    """
+    Starts Playwright and launches the headless Chromium kept for every later load.
+    """
+
+    global _playwright, _playwright_browser
+
+    _playwright = await async_playwright().start()
+    try:
+        _playwright_browser = await _playwright.chromium.launch(headless=True)
+    except BaseException:
+        await _playwright.stop()
+        _playwright = None
+        raise
+
+async def _playwright_stop():
+    """
+    Closes the pages, the Chromium and Playwright started by _playwright_start().
+    """
+
+    global _playwright, _playwright_browser
+
+    _playwright_pages.clear()
+    try:
+        await _playwright_browser.close()
+    finally:
+        await _playwright.stop()
+        _playwright = _playwright_browser = None
+
+def _run_playwright(coroutine):
+    """
+    Runs a coroutine like _playwright_fetch_all() on the Playwright event loop and waits for its result.
+    The loop and the Chromium are started on first use and kept alive, so only the first load pays the browser cold start.
+
+    Note:
+        The loop runs in its own thread, so this also works from Jupyter, which already runs an event loop in the main thread.
+    """
+
+    global _playwright_loop
+
+    if async_playwright is None:
+        coroutine.close()
+        raise ImportError("engine='playwright' needs Playwright, please install it with: pip install playwright && playwright install chromium")
+
+    with _playwright_lock:
+        if _playwright_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='playwright', daemon=True).start()
+            try:
+                asyncio.run_coroutine_threadsafe(_playwright_start(), loop).result()
+            except BaseException:
+                loop.call_soon_threadsafe(loop.stop)
+                raise
+            _playwright_loop = loop
+
+    return asyncio.run_coroutine_threadsafe(coroutine, _playwright_loop).result()
+
+def _close_playwright():
+    """
+    Closes the Chromium kept by _run_playwright() and stops its event loop. The next Playwright load starts a new one.
+    """
+
+    global _playwright_loop
+
+    with _playwright_lock:
+        if _playwright_loop is None:
+            return
+        loop, _playwright_loop = _playwright_loop, None
+        try:
+            asyncio.run_coroutine_threadsafe(_playwright_stop(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+async def _playwright_fetch_all(urls:list, concurrency:int=DRIVER_WORKERS, wait_for:str=None):
+    """
+    Loads every URL in the headless Chromium kept by _run_playwright(), with up to `concurrency` pages, each in its own 
+    browser context, loading side by side. Pages are read as soon as their DOM is ready, without waiting for images and 
+    other subresources, and are left open for the next call.
+
+    Args:
+        urls (list): The URLs to load.
+        concurrency (int, optional): The number of pages. Defaults to DRIVER_WORKERS.
+        wait_for (str, optional): The CSS selector of an element to wait for after the DOM is ready, see _driver_get(). Defaults to None.
+
+    Returns:
+        list: The HTML of each webpage, in the same order as `urls`. A failed load is returned as its exception.
+    """
+
+    pool = asyncio.Queue()
+    for _ in range(max(1, min(concurrency, len(urls)))):
+        if _playwright_pages:
+            page = _playwright_pages.pop()
+        else:
+            context = await _playwright_browser.new_context(user_agent=USER_AGENT, viewport={'width': 1920, 'height': 1080})
+            page = await context.new_page()
+        pool.put_nowait(page)
+
+    async def load(url):
+        page = await pool.get()
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=REQUEST_TIMEOUT * 1000)
+            if wait_for:
+                try:
+                    await page.wait_for_selector(wait_for, state='attached', timeout=DRIVER_WAIT * 1000)
+                except PlaywrightTimeoutError:
+                    pass
+            return await page.content()
+        finally:
+            pool.put_nowait(page)
+
+    try:
+        return await asyncio.gather(*(load(url) for url in urls), return_exceptions=True)
+    finally:
+        while not pool.empty():
+            _playwright_pages.append(pool.get_nowait())
+
+def _playwright_page_source(url:str):
+    """
+    Loads a single URL with Playwright, see _playwright_fetch_all().
+
+    Returns:
+        str: The HTML of the webpage.
+    """
+
+    html = _run_playwright(_playwright_fetch_all([url]))[0]
+    if isinstance(html, Exception):
+        raise html
+    return html
+
 class SinglePage_WebCrawler():
 
     """
@@ -24,7 +381,16 @@ class SinglePage_WebCrawler():
 
     """
 
-    def __init__(self, url:str, html_check:bool=True, category:str='Not defined', owner_source:str='Not defined', as_connector:bool=False, driver:webdriver.Chrome=None, show_progressbar:bool=True):
+    # one crawler is often made per page, slots keep each instance small
+    __slots__ = ('url', 'html_check', 'category', 'owner_source', 'driver', 'as_connector', 'show_progressbar', 'soup', '_session', '_owns_session', 'engine')
+
+    # headless Chrome shared by every crawler that is not given a driver, see shared_driver()
+    _shared_driver = None
+    # extra headless Chrome drivers kept warm for parallel dynamic scraping, see _pool_drivers()
+    _extra_drivers = []
+
+    def __init__(self, url:str, html_check:bool=True, category:str='Not defined', owner_source:str='Not defined', as_connector:bool=False, driver:webdriver.Chrome=None, show_progressbar:bool=True, session:requests.Session=None, parse_only:SoupStrainer=None, cache:bool=False, 
+                 engine:str='selenium'):
         """
         Initialize the SinglePage_WebCrawler with the specified URL and HTML check flag.
         
@@ -33,9 +399,19 @@ class SinglePage_WebCrawler():
             html_check (bool, optional): Flag to indicate whether the content is HTML or not. Defaults to True. Please see Note below if error or content is not found.
             category (str, optional): The category of the web page. Defaults to None.
             owner_source (str, optional): The source of the web page. Defaults to None.
-            as_connector (bool, optional): if True, the driver will not refresh the page or reload the page. Defaults to False.
-            driver (webdriver.Chrome, optional): The webdriver to use. Defaults to None.
+            as_connector (bool, optional): if True, the driver will not refresh the page or reload the page (no driver.get is done), 
+                                           the page currently loaded in the driver is scraped instead. Defaults to False.
+            driver (webdriver.Chrome, optional): The webdriver to use. Defaults to None, which uses SinglePage_WebCrawler.shared_driver().
             show_progressbar (bool, optional): If True, show a progress bar. Defaults to True.
+            session (requests.Session, optional): The session to fetch static pages with, it is never closed by the crawler. 
+                                                Defaults to None, which creates a new pooled session.
+            parse_only (SoupStrainer, optional): Only build the part of the page matched by this strainer. Defaults to None, which parses the whole page.
+            cache (bool, optional): If True, static pages are cached on disk so re-running a crawl doesn't fetch them again. 
+                                    Only used when no session is passed. Defaults to False.
+            engine (str, optional): The browser used when html_check is False, 'selenium' or 'playwright'. Defaults to 'selenium'.
+                                    Playwright loads pages over one persistent connection and returns as soon as the DOM is ready, 
+                                    it doesn't use driver or as_connector. Every crawler shares one headless Chromium, started on first 
+                                    use and kept until SinglePage_WebCrawler.close_shared_driver().
         
         Returns:
             None
@@ -43,6 +419,10 @@ class SinglePage_WebCrawler():
         Note:
             html_check also check static content if html_check is True and dynamic content if html_check is False. 
             If you are unsure about this flag, try scraping with html_check=True first. If content is not found, try html_check=False.
+
+            parse_only is applied once when the page is parsed, so every method only sees the strained part of the page.
+            For example, parse_only=SoupStrainer('div', class_='image-class') is enough for get_images('div', 'image-class')
+            and is much cheaper to build than the whole page.
         
         Suggession:
             If you want to scrape more content than provided built-in functions, use SinglePage_WebCrawler.soup with single driver will be efficient.
@@ -108,32 +488,122 @@ class SinglePage_WebCrawler():
         self.driver = driver
         self.as_connector = as_connector
         self.show_progressbar = show_progressbar
+        self._session = None
+        self._owns_session = False
+        self.engine = engine
+
+        if engine not in ('selenium', 'playwright'):
+            raise ValueError(f"Invalid engine {engine!r}, engine must be 'selenium' or 'playwright'.")
 
         if html_check:
-            source = requests.get(self.url)
-            self.soup = BeautifulSoup(source.content,'html.parser', from_encoding='utf-8')
+            self._owns_session = not session
+            self._session = session if session else _build_session(cache)
+            self.soup = _get_soup(self._session, self.url, parse_only)
+
+        elif engine == 'playwright':
+            self.soup = BeautifulSoup(_playwright_page_source(self.url), 'lxml', parse_only=parse_only)
         
         else:
 
             if not self.driver:
-                options = webdriver.ChromeOptions()
-                options.add_argument('--headless')
-                options.add_argument('--disable-gpu')
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--window-size=1920,1080")
-                options.add_argument("start-maximized")
-                options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-                self.driver = webdriver.Chrome(options=options)
-                self.driver.implicitly_wait(10)
+                self.driver = self.shared_driver()
             else:
                 self.driver = driver
 
             if not as_connector:
-                self.driver.get(self.url)
+                _driver_get(self.driver, self.url)
 
             html = self.driver.page_source
-            self.soup = BeautifulSoup(html, from_encoding='utf-8')
+            self.soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+    @classmethod
+    def shared_driver(cls, options:webdriver.ChromeOptions=None):
+        """
+        Returns the headless Chrome driver shared by every crawler, starting it on first use.
+        Reusing one warm driver avoids the 1-2 seconds Chrome cold start for each crawler.
+
+        Args:
+            options (webdriver.ChromeOptions, optional): The options to start Chrome with. Only used when the driver is started. 
+                                                         Defaults to None, which starts a headless Chrome.
+
+        Returns:
+            webdriver.Chrome: The shared driver.
+        """
+
+        if SinglePage_WebCrawler._shared_driver is None:
+            driver = webdriver.Chrome(options=options if options else _build_chrome_options())
+            SinglePage_WebCrawler._shared_driver = driver
+
+        return SinglePage_WebCrawler._shared_driver
+
+    @classmethod
+    def _pool_drivers(cls, count:int):
+        """
+        Returns `count` extra headless Chrome drivers, starting only the ones that are not warm yet.
+        Missing drivers are started side by side, so warming the pool costs one Chrome cold start instead of one per driver.
+
+        Args:
+            count (int): The number of drivers needed.
+
+        Returns:
+            list: The extra drivers.
+
+        Raises:
+            WebDriverException: If a driver can't be started, the drivers that did start are kept for the next call.
+        """
+
+        # the drivers only read the options when they start, so they can share one
+        options = _build_chrome_options()
+
+        missing = count - len(SinglePage_WebCrawler._extra_drivers)
+        if missing > 0:
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                futures = [executor.submit(webdriver.Chrome, options=options) for _ in range(missing)]
+
+            # keep every driver that started before raising, so close_shared_driver() can still quit them
+            error = None
+            for future in futures:
+                try:
+                    SinglePage_WebCrawler._extra_drivers.append(future.result())
+                except Exception as start_error:
+                    error = error or start_error
+            if error:
+                raise error
+
+        return SinglePage_WebCrawler._extra_drivers[:count]
+
+    @classmethod
+    def close_shared_driver(cls):
+        """
+        Quits the shared driver, the extra drivers used for parallel scraping and the Chromium kept for engine='playwright'. 
+        The next shared_driver() call or Playwright load starts a new one.
+        """
+
+        if SinglePage_WebCrawler._shared_driver is not None:
+            SinglePage_WebCrawler._shared_driver.quit()
+            SinglePage_WebCrawler._shared_driver = None
+
+        for driver in SinglePage_WebCrawler._extra_drivers:
+            driver.quit()
+        SinglePage_WebCrawler._extra_drivers = []
+
+        _close_playwright()
+
+    def close(self):
+        """
+        Closes the session this crawler built. A session passed in by the caller is never closed, so its connections can be reused.
+        The shared driver is left running for the other crawlers, quit it with SinglePage_WebCrawler.close_shared_driver() once crawling is done.
+        The crawler can also be used as a context manager, which calls close() on exit.
+        """
+
+        if self._session and self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_text(self):
         """
@@ -142,7 +612,7 @@ class SinglePage_WebCrawler():
         Returns the joined text content as a string.
         """
 
-        text = ' '.join(self.soup.text.split())
+        text = _WS_RE.sub(' ', self.soup.get_text()).strip()
         return text
     
     def get_title(self):
@@ -169,8 +639,9 @@ class SinglePage_WebCrawler():
         soup = self.soup.find(image_area_tag, class_=image_area_class)
         images = list()
         for img in soup.find_all('img'):
-            if img['src'].lower().endswith(('.jpg', '.jpeg', '.png')):
-                images.append(img['src'])
+            src = img.get('src', '')
+            if _IMG_RE.search(src):
+                images.append(src)
         return images
 
     def get_banner_image(self, banner_tag:str='src' , banner_class:str=None):
@@ -199,15 +670,15 @@ class SinglePage_WebCrawler():
             content_area_class (str, optional): The CSS class of the content area. Defaults to None.
 
         Returns:
-            tuple: A tuple containing the title and content extracted from the webpage.
+            tuple: A tuple containing the title and content extracted from the webpage. The content is a single string with its whitespace collapsed.
         """
 
         try:
             title = ' '.join(self.soup.find(title_tag, class_=title_class).stripped_strings)
-            content = self.soup.find(content_area_tag, class_=content_area_class).text.split()
-        except:
+            content = _WS_RE.sub(' ', self.soup.find(content_area_tag, class_=content_area_class).text).strip()
+        except (AttributeError, KeyError, TypeError):
             title = ''
-            content = self.soup.find().text.split()
+            content = _WS_RE.sub(' ', self.soup.find().text).strip()
             
         return title, content
 
@@ -223,12 +694,15 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
         like 'page={0}' or any integer.
     """
 
-    def _local_html_webscraping(self,url:str=None):
+    __slots__ = ()
+
+    def _local_html_webscraping(self,url:str=None, parse_only:SoupStrainer=None):
         """
         Perform webscraping on a local URL. If no URL is provided, it uses the default URL.
         
         Parameters:
             url (str, optional): The URL to scrape data from. Defaults to None.
+            parse_only (SoupStrainer, optional): Only build the part of the page matched by this strainer. Defaults to None.
         
         Returns:
             BeautifulSoup: Parsed HTML content of the webpage.
@@ -242,19 +716,19 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             local_url = self.url
         
         if self.html_check:
-            source = requests.get(local_url)
-            soup = BeautifulSoup(source.content,'html.parser', from_encoding='utf-8')
+            soup = _get_soup(self._session, local_url, parse_only)
         else:
             print('Invalid html_check, html_check must be html_check=True.')
 
         return soup
 
-    def _local_not_html_webscraping(self,url:str=None):
+    def _local_not_html_webscraping(self,url:str=None, parse_only:SoupStrainer=None):
         """
         Perform webscraping on a local URL. If no URL is provided, it uses the default URL.
         
         Parameters:
             url (str, optional): The URL to scrape data from. Defaults to None.
+            parse_only (SoupStrainer, optional): Only build the part of the page matched by this strainer. Defaults to None.
         
         Returns:
             BeautifulSoup: Parsed HTML content of the webpage.
@@ -269,35 +743,126 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             local_url = self.url
 
         if not self.html_check:
-            if not self.as_connector:
-                self.driver.get(local_url)
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, from_encoding='utf-8')
+            if self.engine == 'playwright':
+                html = _playwright_page_source(local_url)
+            else:
+                if not self.as_connector:
+                    _driver_get(self.driver, local_url)
+                html = self.driver.page_source
+            soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
         else:
             print('Invalid html_check, html_check must be html_check=False.')
 
         return soup
     
-    def _local_web_scraping(self,url:str=None):
+    def _local_web_scraping(self,url:str=None, parse_only:SoupStrainer=None):
         """
         Perform webscraping on a local URL. If no URL is provided, it uses the default URL.
         
         Parameters:
             url (str, optional): The URL to scrape data from. Defaults to None.
+            parse_only (SoupStrainer, optional): Only build the part of the page matched by this strainer. Defaults to None.
         
         Returns:
             BeautifulSoup: Parsed HTML content of the webpage.
         """
 
         if self.html_check:
-            soup = self._local_html_webscraping(url)
+            soup = self._local_html_webscraping(url, parse_only)
         else:
-            soup = self._local_not_html_webscraping(url)
+            soup = self._local_not_html_webscraping(url, parse_only)
 
         return soup
 
+    def _local_scraping_as_completed(self, urls:list, parse, wait_for:str=None):
+        """
+        Fetches a list of URLs concurrently and parses each page as soon as it arrives. Static pages are fetched by 
+        FETCH_WORKERS threads sharing the session, dynamic pages by a pool of DRIVER_WORKERS drivers, the shared driver 
+        and the ones kept warm by _pool_drivers() (or one by one with the driver if it was passed in by the caller or 
+        as_connector is True), or by Playwright.
+
+        Parameters:
+            urls (list): The URLs to scrape data from.
+            parse (callable): Called as parse(url, html) in the worker thread, html is a str, bytes or a file-like response stream.
+            wait_for (str, optional): For dynamic pages, the CSS selector of the element to wait for, see _driver_get(). Defaults to None.
+
+        Yields:
+            tuple: (index, url, page) in the order the pages finish, where index is the position of url in `urls` and page is 
+                   what parse returned, or the exception if the page can't be fetched.
+        """
+
+        if not self.html_check and self.engine == 'playwright':
+            for index, (url, html) in enumerate(zip(urls, _run_playwright(_playwright_fetch_all(urls, wait_for=wait_for)))):
+                yield index, url, html if isinstance(html, Exception) else parse(url, html)
+            return
+
+        if self.html_check:
+            workers = FETCH_WORKERS
+
+            def load(url):
+                with self._session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as source:
+                    source.raw.decode_content = True
+                    return parse(url, source.raw)
+
+        else:
+            workers = min(DRIVER_WORKERS, len(urls))
+            # a driver passed in by the caller may carry cookies, a login or a proxy that the pool drivers don't have
+            if self.as_connector or workers < 2 or self.driver is not SinglePage_WebCrawler._shared_driver:
+                for index, url in enumerate(urls):
+                    try:
+                        if not self.as_connector:
+                            _driver_get(self.driver, url, wait_for)
+                        html = self.driver.page_source
+                    except WebDriverException as error:
+                        yield index, url, error
+                        continue
+                    yield index, url, parse(url, html)
+                return
+
+            pool = queue.Queue()
+            for driver in [self.driver] + self._pool_drivers(workers - 1):
+                pool.put(driver)
+
+            def load(url):
+                driver = pool.get()
+                try:
+                    _driver_get(driver, url, wait_for)
+                    html = driver.page_source
+                finally:
+                    pool.put(driver)
+                return parse(url, html)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(load, url): (index, url) for index, url in enumerate(urls)}
+            for future in as_completed(futures):
+                index, url = futures[future]
+                try:
+                    yield index, url, future.result()
+                except (requests.RequestException, urllib3.exceptions.HTTPError, WebDriverException) as error:
+                    # the static pages are parsed from response.raw, so body read errors come from urllib3
+                    yield index, url, error
+
+    def _local_article_strainer(self, tag_dict:dict):
+        """
+        Builds the SoupStrainer keeping only what get_articles() reads from an article page: the title tag, 
+        the content area tag (with everything inside it), the images for the banner and the <title> fallback.
+
+        Args:
+            tag_dict (dict): The tag dictionary passed to get_articles().
+
+        Returns:
+            SoupStrainer: The strainer, or None if the title or content area tag is not given since any tag can match then.
+        """
+
+        title_tag = tag_dict['title_tag_in_ArticlePage']
+        content_area_tag = tag_dict['content_area_tag_in_ArticlePage']
+        if not title_tag or not content_area_tag:
+            return None
+
+        return SoupStrainer(list({title_tag, content_area_tag, 'img', 'title'}))
+
     def _local_get_content_sep(self,soup:BeautifulSoup=None, title_tag:str=None, 
-                               title_class:str=None, content_area_tag:str=None, content_area_class:str=None):
+                               title_class:str=None, content_area_tag:str=None, content_area_class:str=None, content_node:Tag=None):
         """
         Retrieves the title and content from the given BeautifulSoup object.
 
@@ -307,9 +872,11 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             title_class (str, optional): The CSS class of the title. Defaults to None.
             content_area_tag (str, optional): The HTML tag for the content area. Defaults to None.
             content_area_class (str, optional): The CSS class of the content area. Defaults to None.
+            content_node (Tag, optional): The content area already located in soup. Defaults to None, which finds it with content_area_tag and content_area_class.
 
         Returns:
-            tuple: A tuple containing the title and content extracted from the BeautifulSoup object.
+            tuple: A tuple containing the title and content extracted from the BeautifulSoup object. The content is a single string with its whitespace collapsed.
+                   If the title is not found, the page title is returned instead, if the content area is not found, the content is empty.
 
         Raises:
             None
@@ -317,11 +884,15 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
         
         try:
             title = ' '.join(soup.find(title_tag, class_=title_class).stripped_strings)
-            content = soup.find(content_area_tag, class_=content_area_class).text.split()
-            
-        except:
-            title = soup.title.text
-            content = soup.find().text.split()
+        except (AttributeError, KeyError, TypeError):
+            title = soup.title.text if soup.title else ''
+
+        try:
+            if content_node is None:
+                content_node = soup.find(content_area_tag, class_=content_area_class)
+            content = _WS_RE.sub(' ', content_node.text).strip()
+        except (AttributeError, KeyError, TypeError):
+            content = ''
 
         return title, content
 
@@ -345,7 +916,8 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
         
         return banner
     
-    def _local_get_images_sep(self,soup:BeautifulSoup=None, image_area_tag:str=None, image_area_class:str=None):
+    def _local_get_images_sep(self,soup:BeautifulSoup=None, image_area_tag:str=None, image_area_class:str=None, image_area:Tag=None, 
+                              exclude:str=None):
         """
         Retrieves a list of image URLs from a BeautifulSoup object.
 
@@ -353,16 +925,22 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             soup (BeautifulSoup, optional): The BeautifulSoup object to search for images. Defaults to None.
             image_area_tag (str, optional): The HTML tag of the image area. Defaults to None.
             image_area_class (str, optional): The CSS class of the image area. Defaults to None.
+            image_area (Tag, optional): The image area already located in soup. Defaults to None, which finds it with image_area_tag and image_area_class.
+            exclude (str, optional): An image URL to leave out, like the banner. Defaults to None.
 
         Returns:
             list: A list of image URLs.
         """
 
-        soup = soup.find(image_area_tag, class_=image_area_class)
+        if image_area is None:
+            image_area = soup.find(image_area_tag, class_=image_area_class)
         images = list()
-        for img in soup.find_all('img'):
-            if img['src'].lower().endswith(('.jpg', '.jpeg', '.png')):
-                images.append(img['src'])
+        for img in image_area.find_all('img'):
+            src = img.get('src', '')
+            if src == exclude:
+                continue
+            if _IMG_RE.search(src):
+                images.append(src)
             
         return images
 
@@ -379,52 +957,115 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             custom_pageindex_list (list, optional): A list of custom page indexes. Defaults to None.
 
         Returns:
-            list: A list of unique URLs for the web pages.
+            list: A list of unique URLs for the web pages, in the order they were found.
         """
         
-        pages_list = []
+        # dict keys keep the urls unique and in the order they were found
+        pages_list = {}
+        page_index = custom_pageindex_list or range(start_page, end_page+1, step_page)
+        url_template = self.url
+        others = url_template.replace('{0}', '')
+        if '{' in others or '}' in others:
+            urls = [url_template.format(i) for i in page_index]
+        else:
+            # '{0}' is the only placeholder, replace() skips parsing the format string for every page
+            urls = [url_template.replace('{0}', str(i)) for i in page_index]
+        # only the links are needed from the listing pages, so they are read with lxml directly without building a soup
+        links = _lxml_selector('a[href]', a_class)
+
+        def parse(url, html):
+            tree = _lxml_tree(html)
+            if tree is None:
+                # empty page
+                return {}
+
+            # resolve the common href forms inline, only the rest goes through the cached urljoin()
+            base = urlsplit(url)
+            base_prefix = f'{base.scheme}://{base.netloc}'
+            # dict keys, so a page's repeated links are dropped before they reach the merge
+            hrefs = {}
+            for read_more in links(tree):
+                href = read_more.get('href')
+                if href.startswith(('http://', 'https://')):
+                    pass
+                elif href.startswith('//'):
+                    href = f'{base.scheme}:{href}'
+                elif href.startswith('/'):
+                    href = base_prefix + href
+                else:
+                    href = _urljoin(url, href)
+                hrefs[href] = None
+            return hrefs
+
+        pages = self._local_scraping_as_completed(urls, parse, wait_for=_css_selector('a', a_class))
         if self.show_progressbar:
-            if custom_pageindex_list:
-                for i in tqdm(custom_pageindex_list,desc='Page number'):
-                    url = self.url.format(i)
-                    soup = self._local_web_scraping(url=url)
-            
-                    for read_more in soup.find_all('a', class_=a_class, href=True):
-                        if not read_more['href'].startswith('http'):
-                            read_more['href'] = urljoin(url, read_more['href'])
-                        pages_list.append(read_more['href'])
+            pages = tqdm(pages, total=len(urls), desc='Page number')
 
-            else:
-                for i in tqdm(range(start_page, end_page+1, step_page),desc='Page number'):
-                    url = self.url.format(i)
-                    soup = self._local_web_scraping(url=url)
-            
-                    for read_more in soup.find_all('a', class_=a_class, href=True):
-                        if not read_more['href'].startswith('http'):
-                            read_more['href'] = urljoin(url, read_more['href'])
-                        pages_list.append(read_more['href'])
-        else:
-            if custom_pageindex_list:
-                for i in custom_pageindex_list:
-                    url = self.url.format(i)
-                    soup = self._local_web_scraping(url=url)
-            
-                    for read_more in soup.find_all('a', class_=a_class, href=True):
-                        if not read_more['href'].startswith('http'):
-                            read_more['href'] = urljoin(url, read_more['href'])
-                        pages_list.append(read_more['href'])
+        page_hrefs = [{} for _ in urls]
+        for index, url, hrefs in pages:
+            if isinstance(hrefs, Exception):
+                print("Can't fetch page from :", url)
+                continue
+            page_hrefs[index] = hrefs
 
-            else:
-                for i in range(start_page, end_page+1, step_page):
-                    url = self.url.format(i)
-                    soup = self._local_web_scraping(url=url)
-            
-                    for read_more in soup.find_all('a', class_=a_class, href=True):
-                        if not read_more['href'].startswith('http'):
-                            read_more['href'] = urljoin(url, read_more['href'])
-                        pages_list.append(read_more['href'])
+        # merge in page order, so the result doesn't depend on which page finished first
+        for hrefs in page_hrefs:
+            pages_list.update(hrefs)
+
+        return list(pages_list)
 
-        return list(set(pages_list))
+    def _scrape_one_article(self, url:str, soup:BeautifulSoup, tag_dict:dict):
+        """
+        Retrieves the title, content, banner and images of one article page.
+
+        Args:
+            url (str): The URL of the article.
+            soup (BeautifulSoup): The parsed article page.
+            tag_dict (dict): The tag dictionary passed to get_articles().
+
+        Returns:
+            dict: The article information, see get_articles(). The banner is None and the images are [] if they are not found.
+
+        Raises:
+            ValueError: If the content area is not found or empty, or the title and content tags of the tag dictionary can't be used on the page.
+        """
+
+        try:
+            # the content area is also the image area, find it once for both
+            # soup.find() walks the tree faster than a soupsieve selector, which matches in Python as well
+            content_node = soup.find(tag_dict['content_area_tag_in_ArticlePage'], class_=tag_dict['content_area_class_in_ArticlePage'])
+            if content_node is None:
+                # checked here so _local_get_content_sep() doesn't search the page for it again
+                raise ValueError("Can't find content area")
+            title_return, content_return = self._local_get_content_sep(soup=soup, title_tag=tag_dict['title_tag_in_ArticlePage'], 
+                                                                title_class=tag_dict['title_class_in_ArticlePage'],
+                                                                content_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
+                                                                content_area_class=tag_dict['content_area_class_in_ArticlePage'],
+                                                                content_node=content_node)
+            if not content_return:
+                raise ValueError("Can't find contents")
+
+        except (AttributeError, KeyError, TypeError) as error:
+            raise ValueError("Can't get title and content") from error
+
+        # the banner and the images are optional, a page without them still gives an article
+        try:
+            banner_return = self._local_get_banner_image_sep(soup=soup, banner_tag=tag_dict['banner_tag_in_ArticlePage'], 
+                                                            banner_class=tag_dict['banner_class_in_ArticlePage'])
+        except (AttributeError, KeyError, TypeError):
+            #print("Can't find banner. Please check web tag from :",url)
+            banner_return = None
+
+        try:
+            image_return = self._local_get_images_sep(soup=soup, image_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
+                                                            image_area_class=tag_dict['content_area_class_in_ArticlePage'],
+                                                            image_area=content_node, exclude=banner_return)
+        except (AttributeError, KeyError, TypeError):
+            #print("Can't find images. Please check web tag from :",url)
+            image_return = []
+
+        return {'url':url,'category':self.category, 'title':title_return,'owner source':self.owner_source,
+                'content':content_return, 'banner':banner_return, 'image':image_return}
 
     def get_articles(self, tag_dict:dict=None):
         """
@@ -464,6 +1105,7 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
             - If the tag dictionary is missing any required keys, an error message will be printed and an empty list will be returned.
             - If the scraping process encounters any errors, the URLs of the articles that failed to scrape will be stored in the `diff` list.
             - If the banner image is found in the list of images, it will be removed from the list.
+            - If the banner or the images are not found, the article is kept with a banner of None or an empty image list.
 
         Example:
             >>> from WebScraping_Crawler import MultiPage_WebCrawler
@@ -491,105 +1133,57 @@ class MultiPage_WebCrawler(SinglePage_WebCrawler):
         if not tag_dict:
             raise Exception("Tag dictionary is not provided. Please see the example.")
 
-        title_return = None
-        content_return = None
-        banner_return = None
-        image_return = None
-        contents = []
+        # read outside the per-article error handling, by the strainer and the driver wait
+        missing_keys = [key for key in ('title_tag_in_ArticlePage', 'title_class_in_ArticlePage', 
+                                        'content_area_tag_in_ArticlePage', 'content_area_class_in_ArticlePage') if key not in tag_dict]
+        if missing_keys:
+            print(f"Tag dictionary is missing {missing_keys}. Please check web tag for {self.url}.")
+            return []
+
         diff = []
 
         try:
             articles_url = self.get_pages_url_list(start_page=tag_dict['start_page'], end_page=tag_dict['end_page'], step_page=tag_dict['step_page'], 
                                                 a_class=tag_dict['a_class_in_PageList'],custom_pageindex_list=tag_dict['custom_pageindex_list'])
-        except:
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            articles_url = []
             print(f"get_pages_url_list() can't get articles url. Please check web tag for {self.url}: (start_page|end_page|step_page|a_class_in_PageList|custom_pageindex_list)")
 
+        strainer = self._local_article_strainer(tag_dict)
+
+        def parse(url, html):
+            # the drivers return str, only the bytes of static pages need their encoding guessed
+            from_encoding = None if isinstance(html, str) else 'utf-8'
+            return BeautifulSoup(html, 'lxml', parse_only=strainer, from_encoding=from_encoding)
+
+        article_pages = self._local_scraping_as_completed(articles_url, parse, 
+                                                          wait_for=_css_selector(tag_dict['content_area_tag_in_ArticlePage'], tag_dict['content_area_class_in_ArticlePage']))
         if self.show_progressbar:
-            for articles in tqdm(articles_url,desc='Article number'):
-                try:
-                    soup_sep = self._local_web_scraping(url=articles)
-                    title_return, content_return = self._local_get_content_sep(soup=soup_sep, title_tag=tag_dict['title_tag_in_ArticlePage'], 
-                                                                        title_class=tag_dict['title_class_in_ArticlePage'],
-                                                                        content_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
-                                                                        content_area_class=tag_dict['content_area_class_in_ArticlePage'])
-                    if title_return == '':
-                        #print("Can't find title. Please check web tag from :",articles)
-                        continue
-                    
-                    if content_return == '':
-                        #print("Can't find contents. Please check web tag from :",articles)
-                        continue
-                            
-                    banner_return = self._local_get_banner_image_sep(soup=soup_sep, banner_tag=tag_dict['banner_tag_in_ArticlePage'], 
-                                                                    banner_class=tag_dict['banner_class_in_ArticlePage'])
-                    
-                    if banner_return == None:
-                        #print("Can't find banner. Please check web tag from :",articles)
-                        pass
-
-                    image_return = self._local_get_images_sep(soup=soup_sep, image_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
-                                                                    image_area_class=tag_dict['content_area_class_in_ArticlePage'])
-                    if image_return == []:
-                        #print("Can't find images. Please check web tag from :",articles)
-                        pass
-                            
-                    if banner_return in image_return:
-                        image_return.remove(banner_return)
-                    
-                    contents.append({'url':articles,'category':self.category, 'title':title_return,'owner source':self.owner_source,
-                                    'content':' '.join(content_return), 'banner':banner_return, 'image':image_return})
-                    
-            
-                except:
-                    diff.append(articles)
-        else:
-            for articles in articles_url:
-                try:
-                    soup_sep = self._local_web_scraping(url=articles)
-                    title_return, content_return = self._local_get_content_sep(soup=soup_sep, title_tag=tag_dict['title_tag_in_ArticlePage'], 
-                                                                        title_class=tag_dict['title_class_in_ArticlePage'],
-                                                                        content_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
-                                                                        content_area_class=tag_dict['content_area_class_in_ArticlePage'])
-                    if title_return == '':
-                        #print("Can't find title. Please check web tag from :",articles)
-                        continue
-                    
-                    if content_return == '':
-                        #print("Can't find contents. Please check web tag from :",articles)
-                        continue
-                            
-                    banner_return = self._local_get_banner_image_sep(soup=soup_sep, banner_tag=tag_dict['banner_tag_in_ArticlePage'], 
-                                                                    banner_class=tag_dict['banner_class_in_ArticlePage'])
-                    
-                    if banner_return == None:
-                        #print("Can't find banner. Please check web tag from :",articles)
-                        pass
-
-                    image_return = self._local_get_images_sep(soup=soup_sep, image_area_tag=tag_dict['content_area_tag_in_ArticlePage'], 
-                                                                    image_area_class=tag_dict['content_area_class_in_ArticlePage'])
-                    if image_return == []:
-                        #print("Can't find images. Please check web tag from :",articles)
-                        pass
-                            
-                    if banner_return in image_return:
-                        image_return.remove(banner_return)
-                    
-                    contents.append({'url':articles,'category':self.category, 'title':title_return,'owner source':self.owner_source,
-                                    'content':' '.join(content_return), 'banner':banner_return, 'image':image_return})
-                    
-            
-                except:
-                    diff.append(articles)
+            article_pages = tqdm(article_pages, total=len(articles_url), desc='Article number')
 
-        try:
-            print('different url web type from the other are :',diff)
-        except:
-            pass
+        # kept by index so contents come out in the order of articles_url
+        articles_contents = [None] * len(articles_url)
+        for index, articles, soup_sep in article_pages:
+            if isinstance(soup_sep, Exception):
+                print("Can't fetch article from :", articles)
+                diff.append(articles)
+                continue
+
+            try:
+                articles_contents[index] = self._scrape_one_article(articles, soup_sep, tag_dict)
+            except ValueError as error:
+                print(f"{error}. Please check web tag from :", articles)
+                diff.append(articles)
+
+        contents = [content for content in articles_contents if content]
+
+        print('different url web type from the other are :',diff)
 
         return contents
 
 #connect to mongodb
-def insert_contents_to_mongoDB(database_address:str,database_name:str,database_colection:str,contents_list:list,show_progressbar:bool=True):
+def insert_contents_to_mongoDB(database_address:str,database_name:str,database_colection:str,contents_list:list,show_progressbar:bool=True,batch_size:int=1000,dedupe_key:str=None,
+                               acknowledged:bool=True,workers:int=INSERT_WORKERS):
 
     """
 	Inserts contents into a MongoDB database.
@@ -600,6 +1194,15 @@ def insert_contents_to_mongoDB(database_address:str,database_name:str,database_c
 	- database_colection: str, the name of the collection in the database.
 	- contents_list: list, a list of contents to be inserted.
     - show_progressbar: bool, whether to show the progress bar.
+    - batch_size: int, the number of contents sent to the server per insert_many/bulk_write call (at most 1000 per server batch).
+    - dedupe_key: str, if given (like 'url'), a content is only inserted when no document with the same value exists yet, 
+      so re-running a crawl doesn't duplicate contents. A unique index is created on the key first, so batches sent side by side 
+      can't insert the same value twice. If the index can't be created, a message is printed and the contents are still upserted, 
+      but concurrent batches may then insert the same value twice. 
+      Contents without the key are skipped and counted as failed. Defaults to None, which inserts every content.
+    - acknowledged: bool, if False, writes are sent with write concern w=0 and the server doesn't answer them. 
+      Faster when durability is not critical, but failed contents are not reported. Defaults to True.
+    - workers: int, the number of batches sent side by side, so the round-trips of different batches overlap. Defaults to INSERT_WORKERS.
 
 	Returns:
 	- None
@@ -610,18 +1213,72 @@ def insert_contents_to_mongoDB(database_address:str,database_name:str,database_c
 
         print("---Connenction Successful---")
 
-        database_name = client[database_name]
+        if dedupe_key:
+            # built through an acknowledged handle, so the index exists before any batch is sent even when acknowledged=False
+            try:
+                client[database_name][database_colection].create_index(dedupe_key, unique=True)
+            except OperationFailure as error:
+                # like documents already duplicated on the key, the upserts still skip existing contents
+                print(f"Can't create unique index on {dedupe_key}:", error)
+
+        if acknowledged:
+            database_name = client[database_name]
+        else:
+            database_name = client.get_database(database_name, write_concern=WriteConcern(w=0))
 
         database = database_name[database_colection]
 
-        if show_progressbar:
-            for i in tqdm(contents_list,desc='content number'):
-                database.insert_one(i)
+        def write_batch(batch):
+            # returns (failed, existing) for the batch
+            try:
+                if dedupe_key:
+                    # upsert on the key, $setOnInsert leaves a document that already exists untouched
+                    result = database.bulk_write([UpdateOne({dedupe_key: content[dedupe_key]}, {'$setOnInsert': content}, upsert=True) 
+                                                  for content in batch], ordered=False)
+                    return 0, result.matched_count if result.acknowledged else 0
+                database.insert_many(batch, ordered=False)
+                return 0, 0
+            except BulkWriteError as error:
+                write_errors = error.details['writeErrors']
+                matched = error.details.get('nMatched', 0)
+                if dedupe_key:
+                    # another batch upserted the same key first, the content exists
+                    duplicates = sum(1 for write_error in write_errors if write_error.get('code') == 11000)
+                    write_errors = [write_error for write_error in write_errors if write_error.get('code') != 11000]
+                    matched += duplicates
+                if write_errors:
+                    print(f"Can't insert {len(write_errors)} contents: {write_errors[0]['errmsg']}")
+                return len(write_errors), matched
+
+        contents = contents_list
+        failed = 0
+        if dedupe_key:
+            # a content without the key can't be upserted on it
+            contents = [content for content in contents_list if dedupe_key in content]
+            failed = len(contents_list) - len(contents)
+            if failed:
+                print(f"Can't insert {failed} contents: no {dedupe_key}")
+
+        batches = [contents[i:i+batch_size] for i in range(0, len(contents), batch_size)]
+
+        existing = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+            written = as_completed([executor.submit(write_batch, batch) for batch in batches])
+            if show_progressbar:
+                written = tqdm(written, total=len(batches), desc='content batch')
+
+            for future in written:
+                batch_failed, batch_existing = future.result()
+                failed += batch_failed
+                existing += batch_existing
+
+        if existing:
+            print(f'{existing} contents already exist, skipped')
+
+        if failed:
+            print(f'---Insert Finished, {failed} of {len(contents_list)} contents failed---')
         else:
-            for i in contents_list:
-                database.insert_one(i)
-        
-        print('---Insert Successful---')
+            print('---Insert Successful---')
 
-    except:
-        print("Connection Fail")
\ No newline at end of file
+    except PyMongoError as error:
+        print("Connection Fail:", error)
\ No newline at end of file